@@ -15,12 +15,15 @@ from .const import (
     CONF_TTS_REGION,
     CONF_TTS_VOICE,
     DEFAULT_TTS_VOICE,
+    DEFAULT_TTS_PROFILE,
 )
 from .nova import NovaAIClient
 from .personality import PersonalityManager
 from .memory import MemoryManager
 from .random_events import RandomEventManager
-from .tts import AzureTTSClient
+from .context import HomeContextProvider
+from .fast_path import FastPathRouter
+from .tts import AzureTTSClient, TTS_PROFILES, select_profile
 import aiohttp
 import tempfile
 import os
@@ -61,6 +64,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     await memory_mgr.load()
     hass.data[DOMAIN][entry.entry_id]["memory"] = memory_mgr
 
+    # Home state context
+    context_provider = HomeContextProvider(hass)
+    await context_provider.start()
+    hass.data[DOMAIN][entry.entry_id]["context"] = context_provider
+
+    # Local fast-path router for Assist
+    router = FastPathRouter(hass, client, context_provider)
+    hass.data[DOMAIN][entry.entry_id]["router"] = router
+
     # TTS client
     tts_client = None
     if tts_api_key and tts_region:
@@ -91,7 +103,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             system_prompt = personality_mgr.get_system_prompt()
             memories = memory_mgr.get_memories(5)  # Only get recent 5 memories
             memory_context = "\n".join(memories) if memories else "No previous context."
-            prompt = f"{system_prompt}\n\nPrevious context:\n{memory_context}\n\nUser: {question}"
+            home_context = context_provider.get_context()
+            prompt = f"{system_prompt}\n\n{home_context}\n\nPrevious context:\n{memory_context}\n\nUser: {question}"
             
             async with aiohttp.ClientSession() as session:
                 answer = await client.ask(prompt, session)
@@ -135,20 +148,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         if not tts_client:
             _LOGGER.error("TTS is not configured for Nova.")
             return
-        audio_bytes = await tts_client.synthesize(text)
+        profile = call.data.get("profile") or select_profile(hass, media_player_entity_id)
+        audio_bytes = await tts_client.synthesize(
+            text,
+            profile,
+            voice=call.data.get("voice"),
+            language=call.data.get("language"),
+            rate=call.data.get("rate"),
+            pitch=call.data.get("pitch"),
+            volume=call.data.get("volume"),
+        )
         if not audio_bytes:
             _LOGGER.error("Azure TTS returned no audio.")
             return
+        file_name = f"nova_tts.{TTS_PROFILES.get(profile, TTS_PROFILES[DEFAULT_TTS_PROFILE])['extension']}"
         # Save to a temp file
         tmp_dir = tempfile.gettempdir()
-        file_path = os.path.join(tmp_dir, "nova_tts.mp3")
+        file_path = os.path.join(tmp_dir, file_name)
         with open(file_path, "wb") as f:
             f.write(audio_bytes)
         # Serve the file via media_player
         if media_player_entity_id:
-            url = f"/local/nova_tts.mp3"
+            url = f"/local/{file_name}"
             # Copy to www directory for serving
-            www_path = os.path.join(hass.config.path("www"), "nova_tts.mp3")
+            www_path = os.path.join(hass.config.path("www"), file_name)
             os.makedirs(os.path.dirname(www_path), exist_ok=True)
             with open(www_path, "wb") as f:
                 f.write(audio_bytes)
@@ -167,6 +190,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     hass.services.async_register(DOMAIN, "speak", handle_speak)
 
+    async def handle_benchmark_tts(call):
+        """Handle nova.benchmark_tts service: compare TTS profiles."""
+        if not tts_client:
+            _LOGGER.error("TTS is not configured for Nova.")
+            return
+        text = call.data.get("text") or "Hello, this is Nova speaking!"
+        results = await tts_client.benchmark(text)
+        _LOGGER.info("TTS benchmark: %s", results)
+        hass.bus.async_fire(f"{DOMAIN}_tts_benchmark", {"text": text, "results": results})
+
+    hass.services.async_register(DOMAIN, "benchmark_tts", handle_benchmark_tts)
+
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -176,4 +211,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     random_mgr = data.get("random")
     if random_mgr:
         random_mgr.stop()
+    context_provider = data.get("context")
+    if context_provider:
+        context_provider.stop()
     return True
\ No newline at end of file
@@ -18,6 +18,37 @@ DEFAULT_MOOD = "neutral"
 DEFAULT_MEMORY_SIZE = 100  # Number of remembered events/statements
 DEFAULT_RANDOM_EVENT_INTERVAL = 3600  # seconds
 DEFAULT_TTS_VOICE = "en-US-JennyNeural"
+DEFAULT_TTS_PROFILE = "standard"
+DEFAULT_CONTEXT_MAX_ENTITIES = 60  # Entity budget for the home state prompt block, shared between areas
+CONTEXT_RENDER_DELAY = 1  # seconds to batch state changes before re-rendering the home state block
+CONTEXT_SIGNIFICANT_DIGITS = 3  # numeric states are rounded to this many significant digits
+
+# Domains considered for the home state prompt block
+CONTEXT_DOMAINS = [
+    "alarm_control_panel",
+    "binary_sensor",
+    "climate",
+    "cover",
+    "fan",
+    "light",
+    "lock",
+    "media_player",
+    "sensor",
+    "switch",
+    "vacuum",
+]
+
+# Domains the fast path may turn on/off without asking Nova
+FAST_PATH_TOGGLE_DOMAINS = ["fan", "light", "media_player", "switch"]
+
+# TTS profile chosen for a media player, keyed by its integration platform
+TTS_PLATFORM_PROFILES = {
+    "esphome": "satellite",
+    "cast": "high_quality",
+    "sonos": "high_quality",
+    "heos": "high_quality",
+    "bluesound": "high_quality",
+}
 
 # API Configuration
 NOVA_API_TIMEOUT = 30  # seconds
@@ -0,0 +1,280 @@
+"""Home state context for Nova prompts."""
+
+import logging
+import math
+import re
+
+from homeassistant.components.homeassistant.exposed_entities import (
+    async_listen_entity_updates,
+    async_should_expose,
+)
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    CONTEXT_DOMAINS,
+    CONTEXT_RENDER_DELAY,
+    CONTEXT_SIGNIFICANT_DIGITS,
+    DEFAULT_CONTEXT_MAX_ENTITIES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+NO_AREA = "Other"
+NO_STATE = "No home state available."
+
+APOSTROPHES = re.compile(r"['’]")
+PUNCTUATION = re.compile(r"[^\w\s]")
+
+# Listed after actionable entities when an area has more than its share
+PASSIVE_DOMAINS = frozenset(["binary_sensor", "sensor"])
+
+
+class HomeContextProvider:
+    """Keep a compact, pre-rendered snapshot of exposed entity states.
+
+    The snapshot is built once on start and then maintained from
+    ``state_changed`` and registry events. Changes visible in the snapshot
+    (not sub-rounding sensor noise or attribute-only updates) mark their
+    area stale, and a debounced callback re-renders only those areas, so
+    fetching the context for a prompt is a plain attribute read.
+    """
+
+    def __init__(self, hass: HomeAssistant, domains=CONTEXT_DOMAINS, max_entities=DEFAULT_CONTEXT_MAX_ENTITIES):
+        self.hass = hass
+        self.domains = frozenset(domains)
+        self.max_entities = max_entities
+        self._snapshot = {}  # entity_id -> (area, name, value)
+        self._exposed = {}  # entity_id -> bool
+        self._areas = {}  # entity_id -> area name
+        self._names = {}  # name key -> set of entity_ids
+        self._members = {}  # area name -> set of entity_ids
+        self._lines = {}  # area name -> rendered line
+        self._dirty = set()  # areas whose line is stale
+        self._per_area = None
+        self._rendered = NO_STATE
+        self._unsub_render = None
+        self._unsubs = []
+
+    async def start(self):
+        """Build the initial snapshot and start tracking changes."""
+        for state in self.hass.states.async_all(self.domains):
+            self._update(state)
+        self._render()
+        self._unsubs.append(
+            self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._handle_state_changed)
+        )
+        self._unsubs.append(
+            self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_registry_updated)
+        )
+        self._unsubs.append(
+            self.hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._handle_device_updated)
+        )
+        self._unsubs.append(
+            self.hass.bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._handle_area_updated)
+        )
+        self._unsubs.append(
+            async_listen_entity_updates(self.hass, "conversation", self._handle_exposure_updated)
+        )
+        _LOGGER.debug("Home context tracking %d entities", len(self._snapshot))
+
+    def stop(self):
+        """Stop tracking state changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        if self._unsub_render:
+            self._unsub_render()
+            self._unsub_render = None
+
+    def get_context(self) -> str:
+        """Return the pre-rendered home state block."""
+        return self._rendered
+
+    def find_entity(self, name: str) -> str | None:
+        """Return the exposed entity_id whose friendly name matches ``name``.
+
+        Returns ``None`` when the name is shared by several entities, so the
+        caller can leave disambiguation to something that knows the areas.
+        """
+        entity_ids = self._names.get(_name_key(name))
+        if not entity_ids or len(entity_ids) > 1:
+            return None
+        return next(iter(entity_ids))
+
+    @callback
+    def _handle_state_changed(self, event: Event):
+        entity_id = event.data["entity_id"]
+        if entity_id.split(".", 1)[0] not in self.domains:
+            return
+        self._update(event.data.get("new_state"), entity_id)
+
+    @callback
+    def _handle_registry_updated(self, event: Event):
+        entity_id = event.data["entity_id"]
+        old_entity_id = event.data.get("old_entity_id")
+        if old_entity_id:
+            self._update(None, old_entity_id)
+        if event.data["action"] == "remove":
+            self._update(None, entity_id)
+            return
+        if entity_id.split(".", 1)[0] not in self.domains:
+            return
+        # Exposure, area or name may have changed; recompute from scratch
+        self._exposed.pop(entity_id, None)
+        self._areas.pop(entity_id, None)
+        self._update(self.hass.states.get(entity_id), entity_id)
+
+    @callback
+    def _handle_device_updated(self, event: Event):
+        entity_registry = er.async_get(self.hass)
+        for entity in er.async_entries_for_device(entity_registry, event.data["device_id"]):
+            if entity.entity_id in self._areas:
+                del self._areas[entity.entity_id]
+                self._update(self.hass.states.get(entity.entity_id), entity.entity_id)
+
+    @callback
+    def _handle_area_updated(self, event: Event):
+        # Area renames and removals are rare, so refresh every cached area
+        self._areas.clear()
+        for entity_id in list(self._snapshot):
+            self._update(self.hass.states.get(entity_id), entity_id)
+
+    @callback
+    def _handle_exposure_updated(self):
+        # Exposure of entities without a registry entry changes without a registry event
+        self._exposed.clear()
+        for state in self.hass.states.async_all(self.domains):
+            self._update(state)
+
+    @callback
+    def _handle_render(self, _now):
+        self._unsub_render = None
+        self._render()
+
+    def _update(self, state: State | None, entity_id: str | None = None):
+        entity_id = entity_id or state.entity_id
+        entry = None
+        if state is None:
+            self._exposed.pop(entity_id, None)
+            self._areas.pop(entity_id, None)
+        elif self._is_exposed(entity_id):
+            entry = self._entry_for(state)
+        old = self._snapshot.get(entity_id)
+        if old == entry:
+            return
+        if old is not None:
+            key = _name_key(old[1])
+            self._names[key].discard(entity_id)
+            if not self._names[key]:
+                del self._names[key]
+            self._members[old[0]].discard(entity_id)
+            if not self._members[old[0]]:
+                del self._members[old[0]]
+            self._dirty.add(old[0])
+        if entry is None:
+            del self._snapshot[entity_id]
+            self._areas.pop(entity_id, None)
+        else:
+            self._snapshot[entity_id] = entry
+            self._names.setdefault(_name_key(entry[1]), set()).add(entity_id)
+            self._members.setdefault(entry[0], set()).add(entity_id)
+            self._dirty.add(entry[0])
+        if self._unsub_render is None:
+            self._unsub_render = async_call_later(self.hass, CONTEXT_RENDER_DELAY, self._handle_render)
+
+    def _is_exposed(self, entity_id: str) -> bool:
+        exposed = self._exposed.get(entity_id)
+        if exposed is None:
+            exposed = async_should_expose(self.hass, "conversation", entity_id)
+            self._exposed[entity_id] = exposed
+        return exposed
+
+    def _entry_for(self, state: State):
+        if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        name = state.attributes.get(ATTR_FRIENDLY_NAME) or state.object_id
+        return (self._area_for(state.entity_id), name, _format_value(state))
+
+    def _area_for(self, entity_id: str) -> str:
+        area = self._areas.get(entity_id)
+        if area is not None:
+            return area
+        area_id = None
+        entity = er.async_get(self.hass).async_get(entity_id)
+        if entity:
+            area_id = entity.area_id
+            if not area_id and entity.device_id:
+                device = dr.async_get(self.hass).async_get(entity.device_id)
+                area_id = device.area_id if device else None
+        area_entry = ar.async_get(self.hass).async_get_area(area_id) if area_id else None
+        area = area_entry.name if area_entry else NO_AREA
+        self._areas[entity_id] = area
+        return area
+
+    def _render(self):
+        """Rebuild the lines of stale areas and join them into the context block."""
+        if not self._members:
+            self._lines.clear()
+            self._dirty.clear()
+            self._rendered = NO_STATE
+            return
+        # Every area gets an equal share so none is dropped entirely
+        per_area = max(self.max_entities // len(self._members), 1)
+        if per_area != self._per_area:
+            self._per_area = per_area
+            self._dirty.update(self._members)
+        for area in self._dirty:
+            if area in self._members:
+                self._lines[area] = self._render_area(area)
+            else:
+                self._lines.pop(area, None)
+        self._dirty.clear()
+        areas = sorted(self._lines, key=lambda area: (area == NO_AREA, area))
+        self._rendered = "Home state:\n" + "\n".join(self._lines[area] for area in areas)
+
+    def _render_area(self, area: str) -> str:
+        items = []
+        for entity_id in self._members[area]:
+            _, name, value = self._snapshot[entity_id]
+            passive = entity_id.split(".", 1)[0] in PASSIVE_DOMAINS
+            items.append((passive, name, value))
+        items.sort()
+        shown = [f"{name} {value}" for _, name, value in items[: self._per_area]]
+        if len(items) > self._per_area:
+            shown.append(f"...and {len(items) - self._per_area} more")
+        return f"- {area}: {', '.join(shown)}"
+
+
+def _format_value(state: State) -> str:
+    """Return a short state string, rounding numeric values to significant digits."""
+    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    try:
+        number = float(state.state)
+    except ValueError:
+        number = None
+    if number is None or not math.isfinite(number):
+        value = state.state
+    elif number == 0:
+        value = "0"
+    else:
+        digits = CONTEXT_SIGNIFICANT_DIGITS - 1 - math.floor(math.log10(abs(number)))
+        number = round(number, digits)
+        value = str(int(number)) if digits <= 0 else f"{number:g}"
+    return f"{value} {unit}" if unit else value
+
+
+def _name_key(name: str) -> str:
+    """Return a lookup key ignoring case, punctuation and extra whitespace."""
+    name = APOSTROPHES.sub("", name.lower())
+    return " ".join(PUNCTUATION.sub(" ", name).split())
@@ -52,6 +52,20 @@ class NovaConversationAgent(AbstractConversationAgent):
             personality_mgr = data.get("personality")
             memory_mgr = data.get("memory")
             client = data.get("client")
+            context_provider = data.get("context")
+            router = data.get("router")
+            
+            # Answer deterministic requests locally before calling Nova
+            if router:
+                answer = await router.route(
+                    user_input.text,
+                    user_input.context,
+                    user_input.language,
+                    user_input.conversation_id,
+                    user_input.device_id,
+                )
+                if answer:
+                    return ConversationResult(response=answer)
             
             if not client:
                 return ConversationResult(
@@ -62,8 +76,9 @@ class NovaConversationAgent(AbstractConversationAgent):
             system_prompt = personality_mgr.get_system_prompt() if personality_mgr else "You are a helpful assistant."
             memories = memory_mgr.get_memories() if memory_mgr else []
             memory_context = "\n".join(memories[-5:]) if memories else "No previous context."
+            home_context = context_provider.get_context() if context_provider else "No home state available."
             
-            prompt = f"{system_prompt}\n\nPrevious context:\n{memory_context}\n\nUser: {user_input.text}"
+            prompt = f"{system_prompt}\n\n{home_context}\n\nPrevious context:\n{memory_context}\n\nUser: {user_input.text}"
             
             # Get response from Nova AI
             async with aiohttp.ClientSession() as session:
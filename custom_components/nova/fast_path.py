@@ -0,0 +1,154 @@
+"""Local fast-path routing for deterministic Assist requests."""
+
+import logging
+import re
+import time
+
+from homeassistant.components.conversation import HOME_ASSISTANT_AGENT, async_converse
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import intent
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, FAST_PATH_TOGGLE_DOMAINS
+
+_LOGGER = logging.getLogger(__name__)
+
+TIME_PATTERN = re.compile(r"^what(?:'s| is) the time$|^what time is it$")
+DATE_PATTERN = re.compile(r"^what(?:'s| is) (?:the )?(?:date|day)(?: today)?$|^what day is it(?: today)?$")
+TOGGLE_PATTERNS = [
+    re.compile(r"^(?:please )?(?:turn|switch) (?P<action>on|off) (?:the )?(?P<name>.+?)(?: please)?$"),
+    re.compile(r"^(?:please )?(?:turn|switch) (?:the )?(?P<name>.+?) (?P<action>on|off)(?: please)?$"),
+]
+
+# The patterns rely on the apostrophe in "what's"; others are dropped
+APOSTROPHES = re.compile(r"(?<!what)'")
+PUNCTUATION = re.compile(r"[^\w\s']")
+
+
+class FastPathRouter:
+    """Answer or execute simple requests locally before escalating to Nova.
+
+    Requests are matched against precompiled patterns first, then
+    optionally against Home Assistant's built-in intents. Anything that
+    does not match returns ``None`` and should be sent to the LLM.
+    """
+
+    def __init__(self, hass: HomeAssistant, client=None, context_provider=None, use_builtin_intents=True):
+        self.hass = hass
+        self.client = client
+        self.context_provider = context_provider
+        self.use_builtin_intents = use_builtin_intents
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0  # Nova latency avoided on hits, seconds
+        self.miss_overhead = 0.0  # time spent routing requests that escalate, seconds
+
+    async def route(
+        self,
+        text: str,
+        context: Context | None = None,
+        language: str | None = None,
+        conversation_id: str | None = None,
+        device_id: str | None = None,
+    ) -> str | None:
+        """Return a local answer for ``text``, or ``None`` to escalate."""
+        start = time.monotonic()
+        answer = await self._match_local(_normalize(text))
+        source = "local"
+        if answer is None and self.use_builtin_intents:
+            answer = await self._match_builtin(text, context, language, conversation_id, device_id)
+            source = "builtin"
+        elapsed = time.monotonic() - start
+        if answer is None:
+            self.misses += 1
+            self.miss_overhead += elapsed
+            return None
+
+        self.hits += 1
+        llm_latency = self.client.latency if self.client else None
+        if llm_latency is not None:
+            self.time_saved += max(llm_latency - elapsed, 0.0)
+        _LOGGER.debug("Fast path (%s) answered in %.1f ms", source, elapsed * 1000)
+        self.hass.bus.async_fire(f"{DOMAIN}_fast_path", {
+            "source": source,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            **self.stats,
+        })
+        return answer
+
+    @property
+    def stats(self) -> dict:
+        """Return fast-path hit rate and estimated time saved.
+
+        ``time_saved_s`` is net of ``miss_overhead_s``, the routing time
+        added in front of requests that still went to Nova.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "time_saved_s": round(self.time_saved - self.miss_overhead, 2),
+            "miss_overhead_s": round(self.miss_overhead, 2),
+        }
+
+    async def _match_local(self, text: str) -> str | None:
+        if TIME_PATTERN.match(text):
+            return f"It's {dt_util.now().strftime('%H:%M')}."
+        if DATE_PATTERN.match(text):
+            return f"Today is {dt_util.now().strftime('%A, %B %d')}."
+        if not self.context_provider:
+            return None
+        for pattern in TOGGLE_PATTERNS:
+            match = pattern.match(text)
+            if not match:
+                continue
+            entity_id = self.context_provider.find_entity(match["name"])
+            if not entity_id or entity_id.split(".", 1)[0] not in FAST_PATH_TOGGLE_DOMAINS:
+                return None
+            action = match["action"]
+            try:
+                await self.hass.services.async_call(
+                    "homeassistant",
+                    f"turn_{action}",
+                    {"entity_id": entity_id},
+                    blocking=True,
+                )
+            except HomeAssistantError as e:
+                _LOGGER.warning("Fast path failed to turn %s %s: %s", action, entity_id, e)
+                return f"Sorry, I couldn't turn {action} the {match['name']}."
+            return f"Turned {action} the {match['name']}."
+        return None
+
+    async def _match_builtin(
+        self,
+        text: str,
+        context: Context | None,
+        language: str | None,
+        conversation_id: str | None,
+        device_id: str | None,
+    ) -> str | None:
+        try:
+            result = await async_converse(
+                self.hass,
+                text,
+                conversation_id,
+                context or Context(),
+                language,
+                agent_id=HOME_ASSISTANT_AGENT,
+                device_id=device_id,
+            )
+        except Exception as e:
+            _LOGGER.debug("Built-in intent matching failed: %s", e)
+            return None
+        response = result.response
+        if response.response_type == intent.IntentResponseType.ERROR:
+            return None
+        return response.speech.get("plain", {}).get("speech") or None
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    text = APOSTROPHES.sub("", text.lower().replace("’", "'"))
+    return " ".join(PUNCTUATION.sub(" ", text).split())
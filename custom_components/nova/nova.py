@@ -5,17 +5,22 @@ import aiohttp
 import async_timeout
 import logging
 import json
+import time
 
 from .const import AZURE_API_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
+# Weight of the newest sample in the running latency average
+LATENCY_SMOOTHING = 0.2
+
 class NovaAIClient:
     """Client for communicating with Nova AI API."""
     
     def __init__(self, api_key: str, endpoint: str):
         self.api_key = api_key
         self.endpoint = endpoint.rstrip('/')
+        self.latency = None  # running average of successful requests, seconds
 
     async def ask(self, prompt: str, session: aiohttp.ClientSession, **kwargs) -> str:
         """Send a prompt to Nova AI and return the response."""
@@ -36,6 +41,7 @@ class NovaAIClient:
         }
         
         try:
+            start = time.monotonic()
             async with async_timeout.timeout(AZURE_API_TIMEOUT):
                 async with session.post(
                     f"{self.endpoint}/chat/completions", 
@@ -60,16 +66,21 @@ class NovaAIClient:
                         return "Failed to parse API response."
                     
                     # Handle different response formats
+                    answer = None
                     if "choices" in data and data["choices"]:
                         choice = data["choices"][0]
                         if "message" in choice:
-                            return choice["message"].get("content", "")
+                            answer = choice["message"].get("content", "")
                         elif "text" in choice:
-                            return choice["text"]
+                            answer = choice["text"]
                     elif "response" in data:
-                        return data["response"]
+                        answer = data["response"]
                     elif "content" in data:
-                        return data["content"]
+                        answer = data["content"]
+                    
+                    if answer is not None:
+                        self._record_latency(time.monotonic() - start)
+                        return answer
                     
                     _LOGGER.warning("Unexpected Nova AI API response format: %s", data)
                     return "Received unexpected response format from API."
@@ -83,3 +94,10 @@ class NovaAIClient:
         except Exception as e:
             _LOGGER.error("Nova AI API request failed: %s", e)
             return "An unexpected error occurred. Please try again."
+
+    def _record_latency(self, elapsed: float):
+        """Fold a successful request duration into the running average."""
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency += LATENCY_SMOOTHING * (elapsed - self.latency)
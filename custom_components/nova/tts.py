@@ -3,69 +3,192 @@
 import aiohttp
 import async_timeout
 import logging
+import statistics
+import time
 import xml.sax.saxutils as xml_escape
 
-from .const import AZURE_API_TIMEOUT
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    AZURE_API_TIMEOUT,
+    DEFAULT_TTS_PROFILE,
+    DEFAULT_TTS_VOICE,
+    TTS_PLATFORM_PROFILES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Output formats, see the Azure Speech "X-Microsoft-OutputFormat" header
+TTS_PROFILES = {
+    "low_bandwidth": {"format": "ogg-16khz-16bit-mono-opus", "extension": "ogg"},
+    "satellite": {"format": "riff-16khz-16bit-mono-pcm", "extension": "wav"},
+    "standard": {"format": "audio-16khz-32kbitrate-mono-mp3", "extension": "mp3"},
+    "high_quality": {"format": "audio-48khz-192kbitrate-mono-mp3", "extension": "mp3"},
+}
+
+CHUNK_SIZE = 4096
+BENCHMARK_RUNS = 5
+
+
+def select_profile(hass, entity_id: str | None) -> str:
+    """Pick a TTS profile for the target media player."""
+    if not entity_id:
+        return DEFAULT_TTS_PROFILE
+    state = hass.states.get(entity_id)
+    if state and len(state.attributes.get("group_members") or []) > 1:
+        return DEFAULT_TTS_PROFILE
+    entry = er.async_get(hass).async_get(entity_id)
+    if entry:
+        return TTS_PLATFORM_PROFILES.get(entry.platform, DEFAULT_TTS_PROFILE)
+    return DEFAULT_TTS_PROFILE
+
+
 class AzureTTSClient:
-    def __init__(self, api_key: str, region: str, voice: str = "en-US-JennyNeural"):
+    def __init__(self, api_key: str, region: str, voice: str = DEFAULT_TTS_VOICE):
         self.api_key = api_key
         self.region = region
         self.voice = voice
         self.endpoint = f"https://{region}.tts.speech.microsoft.com/cognitiveservices/v1"
+        self.stats = {}  # profile -> {"requests", "bytes", "first_audio_ms"} of the last request, informational
+
+    def build_ssml(self, text: str, voice: str | None = None, language: str | None = None, **prosody) -> str:
+        """Build the SSML body, wrapping the text in <prosody> if requested."""
+        voice = voice or self.voice
+        # Voice names are "<language>-<region>-<name>", e.g. en-US-JennyNeural
+        language = language or "-".join(voice.split("-")[:2])
+        escaped_text = xml_escape.escape(text.strip())
+        prosody_attrs = " ".join(
+            f"{name}={xml_escape.quoteattr(str(value))}"
+            for name, value in prosody.items()
+            if name in ("rate", "pitch", "volume") and value
+        )
+        if prosody_attrs:
+            escaped_text = f"<prosody {prosody_attrs}>{escaped_text}</prosody>"
+        return f"""<?xml version="1.0" encoding="utf-8"?>
+<speak version="1.0" xml:lang={xml_escape.quoteattr(language)} xmlns="http://www.w3.org/2001/10/synthesis">
+    <voice xml:lang={xml_escape.quoteattr(language)} name={xml_escape.quoteattr(voice)}>
+        {escaped_text}
+    </voice>
+</speak>"""
+
+    async def synthesize(
+        self,
+        text: str,
+        profile: str = DEFAULT_TTS_PROFILE,
+        voice: str | None = None,
+        language: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+        **prosody,
+    ) -> bytes:
+        """Synthesize speech from text using Azure TTS.
 
-    async def synthesize(self, text: str) -> bytes:
-        """Synthesize speech from text using Azure TTS."""
+        ``profile`` selects the output format from ``TTS_PROFILES``. Extra
+        keyword arguments ``rate``, ``pitch`` and ``volume`` are passed
+        through as SSML prosody. A new session is opened unless one is given.
+        """
         if not text or not text.strip():
             _LOGGER.warning("Empty text provided for TTS synthesis")
             return b""
-            
-        # Escape XML entities in the text
-        escaped_text = xml_escape.escape(text.strip())
-        
+
+        if profile not in TTS_PROFILES:
+            _LOGGER.warning("Unknown TTS profile %s, using %s", profile, DEFAULT_TTS_PROFILE)
+            profile = DEFAULT_TTS_PROFILE
+
+        ssml = self.build_ssml(text, voice, language, **prosody)
+
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                audio_data, _ = await self._post(session, profile, ssml)
+        else:
+            audio_data, _ = await self._post(session, profile, ssml)
+        return audio_data
+
+    async def _post(self, session: aiohttp.ClientSession, profile: str, ssml: str) -> tuple[bytes, float | None]:
+        """Send the SSML and return the audio with its time to first audio in ms."""
         headers = {
             "Ocp-Apim-Subscription-Key": self.api_key,
             "Content-Type": "application/ssml+xml",
-            "X-Microsoft-OutputFormat": "audio-16khz-32kbitrate-mono-mp3",
+            "X-Microsoft-OutputFormat": TTS_PROFILES[profile]["format"],
             "User-Agent": "nova-home-assistant/1.0"
         }
-        
-        ssml = f"""<?xml version="1.0" encoding="utf-8"?>
-<speak version="1.0" xml:lang="en-US" xmlns="http://www.w3.org/2001/10/synthesis">
-    <voice xml:lang="en-US" name="{self.voice}">
-        {escaped_text}
-    </voice>
-</speak>"""
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(AZURE_API_TIMEOUT):
-                    async with session.post(
-                        self.endpoint, 
-                        data=ssml, 
-                        headers=headers
-                    ) as resp:
-                        if resp.status == 401:
-                            _LOGGER.error("Azure TTS authentication failed. Check your API key.")
-                            return b""
-                        elif resp.status == 429:
-                            _LOGGER.error("Azure TTS rate limit exceeded.")
-                            return b""
-                        elif resp.status != 200:
-                            error_text = await resp.text()
-                            _LOGGER.error("Azure TTS error (status %d): %s", resp.status, error_text)
-                            return b""
-                        
-                        audio_data = await resp.read()
-                        if len(audio_data) == 0:
-                            _LOGGER.warning("Azure TTS returned empty audio data")
-                        return audio_data
-                        
+            async with async_timeout.timeout(AZURE_API_TIMEOUT):
+                start = time.monotonic()
+                async with session.post(
+                    self.endpoint,
+                    data=ssml,
+                    headers=headers
+                ) as resp:
+                    if resp.status == 401:
+                        _LOGGER.error("Azure TTS authentication failed. Check your API key.")
+                        return b"", None
+                    elif resp.status == 429:
+                        _LOGGER.error("Azure TTS rate limit exceeded.")
+                        return b"", None
+                    elif resp.status != 200:
+                        error_text = await resp.text()
+                        _LOGGER.error("Azure TTS error (status %d): %s", resp.status, error_text)
+                        return b"", None
+
+                    # Stream the body so time to first audio can be measured
+                    chunks = []
+                    first_audio = None
+                    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                        if first_audio is None:
+                            first_audio = time.monotonic() - start
+                        chunks.append(chunk)
+                    audio_data = b"".join(chunks)
+                    if len(audio_data) == 0:
+                        _LOGGER.warning("Azure TTS returned empty audio data")
+                        return audio_data, None
+
+                    first_audio_ms = round(first_audio * 1000, 1)
+                    stats = self.stats.setdefault(profile, {"requests": 0})
+                    stats["requests"] += 1
+                    stats["bytes"] = len(audio_data)
+                    stats["first_audio_ms"] = first_audio_ms
+                    _LOGGER.debug(
+                        "Azure TTS %s: %d bytes, first audio after %.1f ms",
+                        profile, len(audio_data), first_audio_ms,
+                    )
+                    return audio_data, first_audio_ms
+
         except aiohttp.ClientError as e:
             _LOGGER.error("Azure TTS client error: %s", e)
-            return b""
+            return b"", None
         except Exception as e:
             _LOGGER.error("Azure TTS synthesis failed: %s", e)
-            return b""
+            return b"", None
+
+    async def benchmark(self, text: str, runs: int = BENCHMARK_RUNS) -> dict:
+        """Synthesize ``text`` with every profile and return bytes and median time to first audio.
+
+        All requests share one session, and a warm-up request is made first
+        so connection setup is not counted against any profile.
+        """
+        if not text or not text.strip():
+            _LOGGER.warning("Empty text provided for TTS benchmark")
+            return {}
+
+        # Measurements are collected locally; self.stats may be updated by
+        # concurrent speak calls while the benchmark is running
+        ssml = self.build_ssml(text)
+        results = {}
+        async with aiohttp.ClientSession() as session:
+            await self._post(session, DEFAULT_TTS_PROFILE, ssml)
+            for profile in TTS_PROFILES:
+                samples = []
+                sizes = []
+                for _ in range(runs):
+                    audio_data, first_audio_ms = await self._post(session, profile, ssml)
+                    if audio_data:
+                        samples.append(first_audio_ms)
+                        sizes.append(len(audio_data))
+                if samples:
+                    results[profile] = {
+                        "bytes": statistics.median(sizes),
+                        "first_audio_ms": statistics.median(samples),
+                        "runs": len(samples),
+                    }
+        return results